@@ -165,6 +165,12 @@ class ReplacementTask:
 
 
 class TextReplacerApp:
+    OUTPUT_MODE_FULL = "Full copy"
+    OUTPUT_MODE_EDITS = "Edit list"
+    EDIT_LIST_EXT = ".edits.json"
+    EDIT_LIST_VERSION = 1
+    CHUNK_SIZE = 1024 * 1024  # Characters per read when streaming files
+
     def __init__(self, root):
         self.root = root
         root.title("Percentage-based Text Replacer")
@@ -238,7 +244,16 @@ class TextReplacerApp:
         self.output_dir = tk.StringVar(value="")
         ttk.Entry(output_frame, textvariable=self.output_dir, width=20).pack(side="left", padx=5)
         ttk.Button(output_frame, text="Browse", command=self.browse_output_dir).pack(side="right", padx=5)
-        
+
+        # Output mode: full rewritten copies or compact edit-list sidecars
+        mode_frame = ttk.Frame(file_frame)
+        mode_frame.pack(fill="x", padx=5, pady=5)
+
+        ttk.Label(mode_frame, text="Output Mode:").pack(side="left", padx=5)
+        self.output_mode = tk.StringVar(value=self.OUTPUT_MODE_FULL)
+        ttk.Combobox(mode_frame, textvariable=self.output_mode, state="readonly", width=12,
+                     values=[self.OUTPUT_MODE_FULL, self.OUTPUT_MODE_EDITS]).pack(side="left", padx=5)
+
         # Create scrollable frame for tasks - using optimized approach
         tasks_outer_frame = ttk.LabelFrame(main_container, text="Replacement Tasks")
         tasks_outer_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -262,7 +277,9 @@ class TextReplacerApp:
         ttk.Button(buttons_frame, text="Add Replacement Task", command=self.add_task).pack(side="left", padx=5)
         ttk.Button(buttons_frame, text="Save Configuration", command=self.save_config).pack(side="left", padx=5)
         ttk.Button(buttons_frame, text="Load Configuration", command=self.load_config).pack(side="left", padx=5)
-        
+        ttk.Button(buttons_frame, text="Verify Edit List", command=self.verify_edit_lists).pack(side="right", padx=5)
+        ttk.Button(buttons_frame, text="Apply Edit List", command=self.apply_edit_lists).pack(side="right", padx=5)
+
         # Replace button with standard styling
         replace_btn = ttk.Button(main_container, text="Replace All", command=self.perform_replacements)
         replace_btn.pack(pady=10)
@@ -338,6 +355,7 @@ class TextReplacerApp:
             "output_prefix": self.output_prefix.get(),
             "output_suffix": self.output_suffix.get(),
             "output_dir": self.output_dir.get(),
+            "output_mode": self.output_mode.get(),
             "tasks": []
         }
         
@@ -372,7 +390,8 @@ class TextReplacerApp:
             self.output_prefix.set(config.get("output_prefix", "Imp_"))
             self.output_suffix.set(config.get("output_suffix", ""))
             self.output_dir.set(config.get("output_dir", ""))
-            
+            self.output_mode.set(config.get("output_mode", self.OUTPUT_MODE_FULL))
+
             # Clear existing tasks
             for task in self.tasks:
                 task.frame.destroy()
@@ -432,23 +451,10 @@ class TextReplacerApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Could not create output directory: {str(e)}")
                 return
+        write_edit_lists = self.output_mode.get() == self.OUTPUT_MODE_EDITS
         # Show progress dialog
-        progress_dialog = tk.Toplevel(self.root)
-        progress_dialog.title("Processing Files")
-        progress_dialog.transient(self.root)
-        progress_dialog.grab_set()
-        progress_dialog.geometry("300x100")
-        progress_dialog.resizable(False, False)
-        # Center the dialog
-        progress_dialog.geometry("+%d+%d" % (
-            self.root.winfo_rootx() + self.root.winfo_width() // 2 - 150,
-            self.root.winfo_rooty() + self.root.winfo_height() // 2 - 50
-        ))
-        progress_label = ttk.Label(progress_dialog, text="Processing files...")
-        progress_label.pack(pady=10)
-        progress_var = tk.DoubleVar()
-        progress_bar = ttk.Progressbar(progress_dialog, variable=progress_var, maximum=len(files_to_process))
-        progress_bar.pack(fill="x", padx=20, pady=10)
+        progress_dialog, progress_label, progress_var = self.create_progress_dialog(
+            "Processing Files", "Processing files...", len(files_to_process))
 
         # Worker function for each file
         def process_file(file_path):
@@ -457,8 +463,13 @@ class TextReplacerApp:
                     content = f.read()
                 original_chars, original_words = self.count_words_chars(content)
                 modified_content = content
+                # Segments of the output, mapped back to the original (see compose_edit_segments)
+                segments = [(0, len(content))] if content else []
                 for task in task_data:
-                    modified_content = self.process_replacement_task(modified_content, task)
+                    spans = self.find_replacement_spans(modified_content, task)
+                    if write_edit_lists:
+                        segments = self.compose_edit_segments(segments, spans)
+                    modified_content = self.apply_replacement_spans(modified_content, spans)
                 replaced_chars, replaced_words = self.count_words_chars(modified_content)
                 dir_name, file_name = os.path.split(file_path)
                 base_name, ext = os.path.splitext(file_name)
@@ -466,8 +477,20 @@ class TextReplacerApp:
                 prefix = self.output_prefix.get()
                 suffix = self.output_suffix.get()
                 output_file = os.path.join(output_path, f"{prefix}{base_name}{suffix}{ext}")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(modified_content)
+                if write_edit_lists:
+                    edit_list = {
+                        "version": self.EDIT_LIST_VERSION,
+                        "source": os.path.abspath(file_path),
+                        "source_chars": len(content),
+                        "output_file": os.path.abspath(output_file),
+                        "edits": self.segments_to_edits(segments, len(content))
+                    }
+                    output_file += self.EDIT_LIST_EXT
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        json.dump(edit_list, f, ensure_ascii=False, separators=(",", ":"))
+                else:
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        f.write(modified_content)
                 return {
                     "output_file": output_file,
                     "original_chars": original_chars,
@@ -522,6 +545,11 @@ class TextReplacerApp:
     
     def process_replacement_task(self, content, task):
         """Process a single replacement task on content"""
+        spans = self.find_replacement_spans(content, task)
+        return self.apply_replacement_spans(content, spans)
+
+    def find_replacement_spans(self, content, task):
+        """Return the (start, end, replacement) spans a task would replace in content"""
         search_term = task["search_term"]
         use_regex = task["use_regex"]
         case_sensitive = task["case_sensitive"]
@@ -536,7 +564,7 @@ class TextReplacerApp:
                 matches = list(pattern.finditer(content))
             except re.error as e:
                 messagebox.showerror("Regex Error", f"Invalid regular expression: {str(e)}")
-                return content
+                return []
         else:
             if case_sensitive:
                 matches = list(re.finditer(re.escape(search_term), content))
@@ -546,7 +574,7 @@ class TextReplacerApp:
         total_occurrences = len(matches)
         
         if total_occurrences == 0:
-            return content  # No matches, return unchanged
+            return []  # No matches, nothing to replace
         
         # Calculate how many occurrences to replace for each replacement
         replacements = []
@@ -575,17 +603,234 @@ class TextReplacerApp:
                 if i < len(matches):
                     match = matches[i]
                     to_replace.append((match.start(), match.end(), repl["replace_with"]))
-        
+
+        return to_replace
+
+    def apply_replacement_spans(self, content, to_replace):
+        """Apply (start, end, replacement) spans to content"""
+        if not to_replace:
+            return content
+
         # Sort replacements by position (descending)
-        to_replace.sort(key=lambda x: x[0], reverse=True)
-        
+        to_replace = sorted(to_replace, key=lambda x: x[0], reverse=True)
+
         # Apply replacements
         content_list = list(content)
         for start, end, repl in to_replace:
             content_list[start:end] = repl
-        
+
         return ''.join(content_list)
 
+    def compose_edit_segments(self, segments, spans):
+        """Fold replacement spans into the segments describing the current content.
+
+        Segments are either (start, end) ranges copied from the original file or
+        strings of inserted text; their concatenation is the current content.
+        Spans are positions in the current content, so tasks applied one after
+        another still map back to offsets in the original file.
+        """
+        if not spans:
+            return segments
+
+        spans = sorted(spans, key=lambda x: x[0])
+        result = []
+        span_idx = 0
+        skip_until = 0  # End of the span currently being replaced
+        pos = 0
+
+        def emit(segment, seg_start, start, end):
+            if start >= end:
+                return
+            if isinstance(segment, str):
+                result.append(segment[start - seg_start:end - seg_start])
+            else:
+                result.append((segment[0] + start - seg_start, segment[0] + end - seg_start))
+
+        for segment in segments:
+            seg_len = len(segment) if isinstance(segment, str) else segment[1] - segment[0]
+            seg_start, seg_end = pos, pos + seg_len
+            cursor = seg_start
+            while cursor < seg_end:
+                if cursor < skip_until:
+                    cursor = min(seg_end, skip_until)
+                elif span_idx < len(spans) and spans[span_idx][0] < seg_end:
+                    start, end, repl = spans[span_idx]
+                    emit(segment, seg_start, cursor, start)
+                    if repl:
+                        result.append(repl)
+                    cursor = max(cursor, start)
+                    skip_until = end
+                    span_idx += 1
+                else:
+                    emit(segment, seg_start, cursor, seg_end)
+                    cursor = seg_end
+            pos = seg_end
+
+        # Remaining spans are empty matches at the very end of the content
+        for _, _, repl in spans[span_idx:]:
+            if repl:
+                result.append(repl)
+
+        return result
+
+    def segments_to_edits(self, segments, original_length):
+        """Convert output segments into [offset, length, replacement] edits on the original"""
+        edits = []
+        orig_pos = 0
+        pending = []
+        for segment in segments:
+            if isinstance(segment, str):
+                pending.append(segment)
+                continue
+            start, end = segment
+            if start != orig_pos or pending:
+                edits.append([orig_pos, start - orig_pos, ''.join(pending)])
+                pending = []
+            orig_pos = end
+        if orig_pos != original_length or pending:
+            edits.append([orig_pos, original_length - orig_pos, ''.join(pending)])
+        return edits
+
+    def load_edit_list(self, edit_list_file):
+        """Load and validate an edit-list sidecar"""
+        with open(edit_list_file, 'r', encoding='utf-8') as f:
+            edit_list = json.load(f)
+        if edit_list.get("version") != self.EDIT_LIST_VERSION:
+            raise ValueError(f"Unsupported edit list version: {edit_list.get('version')}")
+        return edit_list
+
+    def iter_edit_list_output(self, edit_list):
+        """Stream the original file with the edit list applied, in chunks"""
+        chars_read = 0
+        with open(edit_list["source"], 'r', encoding='utf-8') as f:
+            for offset, length, replacement in edit_list["edits"]:
+                # Copy unchanged text up to the edit
+                while chars_read < offset:
+                    chunk = f.read(min(self.CHUNK_SIZE, offset - chars_read))
+                    if not chunk:
+                        break
+                    chars_read += len(chunk)
+                    yield chunk
+                # Skip the replaced text
+                while chars_read < offset + length:
+                    chunk = f.read(min(self.CHUNK_SIZE, offset + length - chars_read))
+                    if not chunk:
+                        break
+                    chars_read += len(chunk)
+                if chars_read != offset + length:
+                    break
+                if replacement:
+                    yield replacement
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                chars_read += len(chunk)
+                yield chunk
+        if chars_read != edit_list["source_chars"]:
+            raise ValueError(f"Source file has changed since the edit list was written: {edit_list['source']}")
+
+    def apply_edit_list(self, edit_list_file):
+        """Write the full output file described by an edit list"""
+        edit_list = self.load_edit_list(edit_list_file)
+        output_file = edit_list["output_file"]
+        temp_file = output_file + ".tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                for chunk in self.iter_edit_list_output(edit_list):
+                    f.write(chunk)
+            os.replace(temp_file, output_file)
+        except Exception:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        return output_file
+
+    def verify_edit_list(self, edit_list_file):
+        """Check an edit list against the full-copy output; returns None if they match"""
+        edit_list = self.load_edit_list(edit_list_file)
+        output_file = edit_list["output_file"]
+        if not os.path.isfile(output_file):
+            return f"Full-copy output not found: {output_file}"
+        position = 0
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for chunk in self.iter_edit_list_output(edit_list):
+                if f.read(len(chunk)) != chunk:
+                    return f"Output differs near character {position}"
+                position += len(chunk)
+            if f.read(1):
+                return f"Full-copy output is longer than the edited result ({position} characters)"
+        return None
+
+    def apply_edit_lists(self):
+        self.run_edit_list_command("Apply Edit Lists", self.apply_edit_list)
+
+    def verify_edit_lists(self):
+        self.run_edit_list_command("Verify Edit Lists", self.verify_edit_list)
+
+    def run_edit_list_command(self, title, command):
+        """Run an edit-list command on the selected sidecars in a background thread"""
+        import threading
+        file_paths = filedialog.askopenfilenames(
+            filetypes=[("Edit lists", f"*{self.EDIT_LIST_EXT}"), ("All files", "*.*")],
+            title=title
+        )
+        if not file_paths:
+            return
+        progress_dialog, progress_label, progress_var = self.create_progress_dialog(
+            title, "Processing edit lists...", len(file_paths))
+
+        def run():
+            results = []
+            errors = []
+            for completed, file_path in enumerate(file_paths, 1):
+                try:
+                    results.append((file_path, command(file_path)))
+                except Exception as e:
+                    errors.append(f"{file_path}: {str(e)}")
+                def update_progress(completed=completed):
+                    progress_label.config(text=f"Processing edit list {completed} of {len(file_paths)}")
+                    progress_var.set(completed)
+                self.root.after(0, update_progress)
+
+            def finish():
+                progress_dialog.destroy()
+                if command == self.verify_edit_list:
+                    errors.extend(f"{file_path}: {result}" for file_path, result in results if result)
+                    if errors:
+                        messagebox.showerror("Error", "Verification failed:\n" + "\n".join(errors))
+                    else:
+                        messagebox.showinfo("Success", f"{len(results)} edit list(s) match the full-copy output.")
+                elif errors:
+                    messagebox.showerror("Error", "Some edit lists failed to apply:\n" + "\n".join(errors))
+                elif len(results) == 1:
+                    messagebox.showinfo("Success", f"Edit list applied. Output saved to:\n{results[0][1]}")
+                else:
+                    messagebox.showinfo("Success", f"Applied {len(results)} edit lists.\nFiles saved to output location.")
+            self.root.after(0, finish)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def create_progress_dialog(self, title, text, maximum):
+        """Create a modal progress dialog centered on the main window"""
+        progress_dialog = tk.Toplevel(self.root)
+        progress_dialog.title(title)
+        progress_dialog.transient(self.root)
+        progress_dialog.grab_set()
+        progress_dialog.geometry("300x100")
+        progress_dialog.resizable(False, False)
+        # Center the dialog
+        progress_dialog.geometry("+%d+%d" % (
+            self.root.winfo_rootx() + self.root.winfo_width() // 2 - 150,
+            self.root.winfo_rooty() + self.root.winfo_height() // 2 - 50
+        ))
+        progress_label = ttk.Label(progress_dialog, text=text)
+        progress_label.pack(pady=10)
+        progress_var = tk.DoubleVar()
+        progress_bar = ttk.Progressbar(progress_dialog, variable=progress_var, maximum=maximum)
+        progress_bar.pack(fill="x", padx=20, pady=10)
+        return progress_dialog, progress_label, progress_var
+
 
 class ScrolledFrame(ttk.Frame):
     """An optimized scrollable frame widget"""